@@ -1,6 +1,19 @@
 """PR Prompt - Generate pull request review prompts for LLMs."""
 
-from .generator import PrPromptGenerator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .generator import PrPromptGenerator
 
 __version__ = "2.0.1"
 __all__ = ["PrPromptGenerator"]
+
+
+def __getattr__(name: str) -> object:
+    """Import the generator lazily so the CLI can start without loading git."""
+    if name == "PrPromptGenerator":
+        from .generator import PrPromptGenerator  # noqa: PLC0415
+
+        return PrPromptGenerator
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
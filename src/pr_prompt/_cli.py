@@ -0,0 +1,129 @@
+"""Command implementations for the CLI, imported only once a command runs."""
+
+from __future__ import annotations
+
+import datetime
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+import typer
+
+from .cli import PromptType
+from .generator import PrPromptGenerator
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def _console() -> Console:
+    """Create the rich console on first use; it is only needed for --write output."""
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console()
+
+
+def run_generate(
+    prompt_type: PromptType,
+    base_ref: str | None,
+    *,
+    write: bool,
+    blacklist: list[str] | None,
+    context: list[str] | None,
+    fetch: bool | None,
+) -> None:
+    if write:
+        _console().print(f"Generating pr {prompt_type.value} prompt...", style="dim")
+    overrides = _get_overrides(blacklist=blacklist, context=context, fetch=fetch)
+    generator = PrPromptGenerator.from_toml(**overrides)
+    generator_method = _get_generator_method(generator, prompt_type)
+    prompt = generator_method(base_ref)
+
+    _output(prompt, write=write, label=prompt_type.value)
+
+
+def run_overview(
+    base_ref: str | None,
+    *,
+    write: bool,
+    blacklist: list[str] | None,
+    context: list[str] | None,
+    fetch: bool | None,
+) -> None:
+    overrides = _get_overrides(blacklist=blacklist, context=context, fetch=fetch)
+    generator = PrPromptGenerator.from_toml(**overrides)
+    prompt = generator.generate_overview(base_ref)
+
+    _output(prompt, write=write, label="overview")
+
+
+def run_diff(
+    file_patterns: list[str],
+    base_ref: str | None,
+    *,
+    context_lines: int | None,
+    write: bool,
+    blacklist: list[str] | None,
+    fetch: bool | None,
+) -> None:
+    overrides = _get_overrides(
+        blacklist=blacklist, context=None, fetch=fetch, diff_context_lines=context_lines
+    )
+    generator = PrPromptGenerator.from_toml(**overrides)
+    prompt = generator.generate_diff(file_patterns, base_ref)
+
+    if prompt is None:
+        typer.echo(f"No changed files matched: {', '.join(file_patterns)}", err=True)
+        return
+
+    _output(prompt, write=write, label="diff")
+
+
+def _get_overrides(
+    *,
+    blacklist: list[str] | None,
+    context: list[str] | None,
+    fetch: bool | None,
+    diff_context_lines: int | None = None,
+) -> dict[str, list[str] | bool | int]:
+    overrides: dict[str, list[str] | bool | int] = {}
+    if blacklist is not None:
+        overrides["blacklist_patterns"] = blacklist
+    if context is not None:
+        overrides["context_patterns"] = context
+    if fetch is not None:
+        overrides["fetch_base"] = fetch
+    if diff_context_lines is not None:
+        overrides["diff_context_lines"] = diff_context_lines
+    return overrides
+
+
+def _get_generator_method(
+    generator: PrPromptGenerator,
+    prompt_type: PromptType,
+) -> Callable[[str | None], str]:
+    if prompt_type == PromptType.REVIEW:
+        return generator.generate_review
+    if prompt_type == PromptType.DESCRIPTION:
+        return generator.generate_description
+    return generator.generate_custom
+
+
+def _output(prompt: str, *, write: bool, label: str) -> None:
+    if not write:
+        print(prompt)  # noqa: T201
+    else:
+        _write_prompt_to_file(label, prompt)
+
+
+def _write_prompt_to_file(label: str, prompt: str) -> None:
+    output_dir = Path(".pr_prompt")
+    output_dir.mkdir(exist_ok=True)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%d_%H-%M-%S"
+    )
+    output_path = output_dir / f"{label}_{timestamp}.md"
+    output_path.write_bytes(prompt.encode("utf-8"))
+    _console().print(f"✅ Wrote pr {label} prompt to '{output_path}'", style="green")
+    _console().print(f"File size: {len(prompt):,} characters", style="blue")
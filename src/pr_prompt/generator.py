@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .instructions import DESCRIPTION_INSTRUCTIONS, REVIEW_INSTRUCTIONS
 from .markdown_builder import MarkdownBuilder
-from .utils import DiffFile, FileFilter, GitClient, get_diff_files
+from .utils import DiffFile, FileFilter, GitClient, get_diff_files, get_diff_path
 from .utils.config import load_toml_config
 from .utils.errors import MissingCustomInstructionsError
 
+if TYPE_CHECKING:
+    from git import Diff
+
 
 @dataclass
 class PrPromptGenerator:
@@ -66,6 +69,10 @@ class PrPromptGenerator:
     default_base_branch: Optional[str] = None
     custom_instructions: Optional[str] = None
 
+    _diff_files_cache: dict[tuple[object, ...], dict[str, DiffFile]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_toml(cls, **overrides: list[str] | int | bool | str) -> PrPromptGenerator:
         """
@@ -84,7 +91,9 @@ class PrPromptGenerator:
         config = {**toml_config, **overrides}
 
         # Filter to only include valid dataclass fields
-        valid_fields = {field.name for field in cls.__dataclass_fields__.values()}
+        valid_fields = {
+            field.name for field in cls.__dataclass_fields__.values() if field.init
+        }
         filtered_config = {k: v for k, v in config.items() if k in valid_fields}
 
         return cls(**filtered_config)
@@ -240,7 +249,81 @@ class PrPromptGenerator:
         self,
         git: GitClient,
     ) -> dict[str, DiffFile]:
-        """Get diff files filtered by blacklist patterns."""
+        """
+        Get diff files filtered by blacklist patterns.
+
+        The result for the most recent pair of commits is reused, so calling
+        several generate_* methods on the same branches diffs only once.
+        """
+        cache_key = (
+            git.repo.git_dir,
+            git.base_commit.hexsha,
+            git.head_commit.hexsha,
+            self.diff_context_lines,
+            tuple(self.blacklist_patterns),
+        )
+        if cache_key not in self._diff_files_cache:
+            self._diff_files_cache.clear()
+            self._diff_files_cache[cache_key] = self._load_diff_files(git)
+        return self._diff_files_cache[cache_key]
+
+    def _load_diff_files(
+        self,
+        git: GitClient,
+    ) -> dict[str, DiffFile]:
+        """
+        Load diff files from git, filtered by blacklist patterns.
+
+        Blacklisted files are listed from a diff without patches and left out
+        of the patch diff, so git never generates patch text for them (e.g.
+        full lock files). That extra rename-detecting diff only runs when a
+        blacklisted path actually changed.
+        """
+        if not self.blacklist_patterns:
+            return self._load_full_diff_files(git)
+        if not any(
+            FileFilter.is_match(path, self.blacklist_patterns)
+            for path in git.get_changed_paths()
+        ):
+            return self._load_full_diff_files(git)
+
+        summary = git.get_diff_summary()
+        ignored = [
+            FileFilter.is_match(get_diff_path(diff) or "", self.blacklist_patterns)
+            for diff in summary
+        ]
+        if not any(ignored):
+            return self._load_full_diff_files(git)
+
+        kept = [diff for diff, is_ignored in zip(summary, ignored) if not is_ignored]
+        patched: dict[Optional[str], Diff] = {}
+        if kept:
+            kept_paths = {path for diff in kept for path in _get_paths(diff)}
+            excluded_paths = {
+                path
+                for diff, is_ignored in zip(summary, ignored)
+                if is_ignored
+                for path in _get_paths(diff)
+            } - kept_paths
+            diff_index = git.get_diff_index(
+                self.diff_context_lines, exclude_paths=tuple(sorted(excluded_paths))
+            )
+            patched = {get_diff_path(diff): diff for diff in diff_index}
+            if any(get_diff_path(diff) not in patched for diff in kept):
+                # Leaving paths out changed how git paired renames; diff everything.
+                return self._load_full_diff_files(git)
+
+        diffs = [
+            diff if is_ignored else patched[get_diff_path(diff)]
+            for diff, is_ignored in zip(summary, ignored)
+        ]
+        return get_diff_files(diffs, self.blacklist_patterns)
+
+    def _load_full_diff_files(
+        self,
+        git: GitClient,
+    ) -> dict[str, DiffFile]:
+        """Load diff files from one patch diff of every changed file."""
         diff_index = git.get_diff_index(self.diff_context_lines)
         return get_diff_files(diff_index, self.blacklist_patterns)
 
@@ -274,3 +357,7 @@ class PrPromptGenerator:
         builder.add_file_diffs(diff_files)
 
         return builder.build()
+
+
+def _get_paths(diff: Diff) -> list[str]:
+    return [path for path in (diff.a_path, diff.b_path) if path]
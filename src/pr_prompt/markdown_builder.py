@@ -20,10 +20,14 @@ class MarkdownSection:
 
     def render(self) -> str:
         """Render the section as markdown."""
-        heading = "#" * self.heading_level
+        return "".join(self.render_parts())
+
+    def render_parts(self) -> tuple[str, ...]:
+        """Return the markdown fragments of the section, without copying the content."""
+        heading = f"{'#' * self.heading_level} {self.title}"
         if self.content:
-            return f"{heading} {self.title}\n\n{self.content}"
-        return f"{heading} {self.title}"
+            return (heading, "\n\n", self.content)
+        return (heading,)
 
 
 class MarkdownBuilder:
@@ -88,11 +92,11 @@ class MarkdownBuilder:
 
         self.sections.append(MarkdownSection(title="Context Files"))
         for file_path in context_files:
-            if self.git_client.is_binary(self.git_client.head_ref, file_path):
-                continue
-            content = self.git_client.get_file_content(
+            content = self.git_client.get_text_file_content(
                 self.git_client.head_ref, file_path
             )
+            if content is None:
+                continue
             content_md = get_markdown_content(file_path, content)
             self.sections.append(
                 MarkdownSection(
@@ -129,9 +133,10 @@ class MarkdownBuilder:
 
     def build(self) -> str:
         """Build the final prompt."""
-        if not self.sections:
-            return ""
-
-        prompt_parts = [section.render() for section in self.sections]
+        prompt_parts: list[str] = []
+        for section in self.sections:
+            if prompt_parts:
+                prompt_parts.append("\n\n")
+            prompt_parts.extend(section.render_parts())
 
-        return "\n\n".join(prompt_parts)
+        return "".join(prompt_parts)
@@ -1,5 +1,5 @@
 from .changed_files import get_changed_files
-from .diff_parser import DiffFile, get_diff_files
+from .diff_parser import DiffFile, get_diff_files, get_diff_path
 from .file_filters import FileFilter
 from .git_client import GitClient
 from .markdown_parser import get_markdown_content
@@ -10,5 +10,6 @@ __all__ = [
     "GitClient",
     "get_changed_files",
     "get_diff_files",
+    "get_diff_path",
     "get_markdown_content",
 ]
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from typing import Any, Callable
 
 from .errors import InvalidConfigError
 
@@ -45,27 +46,31 @@ def get_pr_prompt_config(config_toml: dict) -> dict:
     return config_toml.get("tool", {}).get("pr-prompt", {})
 
 
+CONFIG_VALIDATORS: dict[str, Callable[[Any], bool]] = {
+    "blacklist_patterns": lambda x: (
+        isinstance(x, list) and all(isinstance(p, str) for p in x)
+    ),
+    "context_patterns": lambda x: (
+        isinstance(x, list) and all(isinstance(p, str) for p in x)
+    ),
+    "diff_context_lines": lambda x: isinstance(x, int) and x >= 0,
+    "include_commit_messages": lambda x: isinstance(x, bool),
+    "repo_path": lambda x: isinstance(x, str),
+    "remote": lambda x: isinstance(x, str),
+    "custom_instructions": lambda x: isinstance(x, str),
+    "default_base_branch": lambda x: isinstance(x, str),
+    "fetch_base": lambda x: isinstance(x, bool),
+}
+
+
 def validate_toml_config(config: dict) -> None:
     """Validate TOML configuration values and raise error if invalid."""
-    validators = {
-        "blacklist_patterns": lambda x: isinstance(x, list)
-        and all(isinstance(p, str) for p in x),
-        "context_patterns": lambda x: isinstance(x, list)
-        and all(isinstance(p, str) for p in x),
-        "diff_context_lines": lambda x: isinstance(x, int) and x >= 0,
-        "include_commit_messages": lambda x: isinstance(x, bool),
-        "repo_path": lambda x: isinstance(x, str),
-        "remote": lambda x: isinstance(x, str),
-        "custom_instructions": lambda x: isinstance(x, str),
-        "default_base_branch": lambda x: isinstance(x, str),
-        "fetch_base": lambda x: isinstance(x, bool),
-    }
-
     for field, value in config.items():
-        if field not in validators:
+        validator = CONFIG_VALIDATORS.get(field)
+        if validator is None:
             msg = f"Unknown config field '{field}' in [tool.pr-prompt]"
             raise InvalidConfigError(msg)
 
-        if not validators[field](value):
+        if not validator(value):
             msg = f"Invalid config for '{field}': {value}"
             raise InvalidConfigError(msg)
@@ -1,10 +1,12 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-from git import Diff, DiffIndex, IndexObject
+from git import Diff, IndexObject
 
 from .file_filters import FileFilter
+from .git_client import BINARY_CHECK_BYTES, is_binary_data, read_text_blob
 from .markdown_parser import get_markdown_content
 
 
@@ -43,7 +45,7 @@ class DiffFile:
 
 
 def get_diff_files(
-    diffs: DiffIndex[Diff],
+    diffs: Iterable[Diff],
     blacklist_patterns: list[str],
 ) -> dict[str, DiffFile]:
     """
@@ -55,7 +57,7 @@ def get_diff_files(
     diff_files = {}
 
     for diff in diffs:
-        file_path = diff.b_path or diff.a_path
+        file_path = get_diff_path(diff)
         if file_path:
             is_blacklisted = FileFilter.is_match(file_path, blacklist_patterns)
 
@@ -76,6 +78,11 @@ def get_diff_files(
     return diff_files
 
 
+def get_diff_path(diff: Diff) -> Optional[str]:
+    """Return the path a diff is keyed by: the new path, or the old one for deletions."""
+    return diff.b_path or diff.a_path
+
+
 def get_change_type(diff: Diff) -> ChangeType:
     if diff.new_file:
         return ChangeType.ADDED
@@ -113,17 +120,14 @@ def get_content_parts(
         content_parts.append("[Diff ignored]")
         return content_parts
 
-    if _is_binary_diff(diff):
-        content_parts.append("[Binary file]")
-        return content_parts
-
     if change_type == ChangeType.ADDED and diff.b_blob and diff.b_path:
-        content = read_blob(diff.b_blob)
-        content_parts.append(get_markdown_content(diff.b_path, content))
+        content_parts.append(get_blob_markdown(diff.b_path, diff.b_blob))
 
     elif change_type == ChangeType.DELETED and diff.a_blob and diff.a_path:
-        content = read_blob(diff.a_blob)
-        content_parts.append(get_markdown_content(diff.a_path, content))
+        content_parts.append(get_blob_markdown(diff.a_path, diff.a_blob))
+
+    elif _is_binary_diff(diff):
+        content_parts.append("[Binary file]")
 
     elif diff.diff:
         content_parts.append("~~~diff")
@@ -133,14 +137,12 @@ def get_content_parts(
     return content_parts
 
 
-def read_blob(blob: IndexObject) -> str:
-    try:
-        blob_data: bytes = blob.data_stream.read()
-        file_content = blob_data.decode("utf-8", errors="replace")
-    except UnicodeDecodeError:
+def get_blob_markdown(file_path: str, blob: IndexObject) -> str:
+    """Render an added/deleted blob; a binary blob is read only up to the binary check."""
+    blob_data = read_text_blob(blob)
+    if blob_data is None:
         return "[Binary file]"
-    else:
-        return file_content
+    return get_markdown_content(file_path, blob_data.decode("utf-8", errors="replace"))
 
 
 def read_diff(diff: Diff) -> str:
@@ -157,7 +159,7 @@ def _is_binary_diff(diff: Diff) -> bool:
     """Check if a diff involves binary files by inspecting blob content for null bytes."""
     for blob in (diff.a_blob, diff.b_blob):
         if blob is not None:
-            chunk: bytes = blob.data_stream.read(8192)
-            if b"\x00" in chunk:
+            chunk: bytes = blob.data_stream.read(BINARY_CHECK_BYTES)
+            if is_binary_data(chunk):
                 return True
     return False
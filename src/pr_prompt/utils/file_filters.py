@@ -1,4 +1,8 @@
 import fnmatch
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Optional
 
 
 class FileFilter:
@@ -9,18 +13,32 @@ class FileFilter:
         """Check if a file path matches any of the given patterns."""
         if not patterns:
             return False
-        return any(fnmatch.fnmatch(file_path, pattern) for pattern in patterns)
+        match = _compile_patterns(tuple(patterns))
+        return match(os.path.normcase(file_path)) is not None
 
     @staticmethod
     def include(files: list[str], patterns: list[str]) -> list[str]:
         """Return sorted files matching any of the given patterns."""
         if not patterns:
             return []
-        return sorted(file for file in files if FileFilter.is_match(file, patterns))
+        match = _compile_patterns(tuple(patterns))
+        return sorted(file for file in files if match(os.path.normcase(file)))
 
     @staticmethod
     def exclude(files: list[str], patterns: list[str]) -> list[str]:
         """Return sorted files **not** matching any of the given patterns."""
         if not patterns:
             return sorted(files)
-        return sorted(file for file in files if not FileFilter.is_match(file, patterns))
+        match = _compile_patterns(tuple(patterns))
+        return sorted(file for file in files if not match(os.path.normcase(file)))
+
+
+@lru_cache(maxsize=256)
+def _compile_patterns(
+    patterns: tuple[str, ...],
+) -> Callable[[str], Optional[re.Match[str]]]:
+    """Compile glob patterns into a single regex alternation, matching like `fnmatch.fnmatch`."""
+    regex = "|".join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+    )
+    return re.compile(regex).match
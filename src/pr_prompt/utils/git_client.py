@@ -1,7 +1,15 @@
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, cast
 
-from git import Blob, Diff, DiffIndex, Repo
+from git import Blob, Commit, Diff, DiffIndex, IndexObject, Repo
+
+if TYPE_CHECKING:
+    from git.diff import Lit_change_type
+
+FULL_FILE_CONTEXT_LINES = 999999
+BINARY_CHECK_BYTES = 8192
+# Total pathspec length kept well below the ~32K command-line limit on Windows.
+MAX_PATHSPEC_CHARS = 16384
 
 
 class GitClient:
@@ -22,6 +30,7 @@ class GitClient:
 
         self.base_commit = self.repo.commit(self.base_ref)
         self.head_commit = self.repo.commit(self.head_ref)
+        self._effective_base: Optional[Commit] = None
 
     def get_default_branch(self) -> str:
         """Get the default branch name from the remote."""
@@ -45,12 +54,13 @@ class GitClient:
             ref = self.base_ref.removeprefix(f"{self.remote.name}/")
             self.remote.fetch(ref)
             self.base_commit = self.repo.commit(self.base_ref)
+            self._effective_base = None
 
     def get_commit_messages(self) -> list[str]:
         """Get list of commit messages between two refs."""
         commits = self.repo.iter_commits(f"{self.base_commit}..{self.head_commit}")
         return [
-            ". ".join(commit.message.strip().split("\n"))
+            ". ".join(commit.message.strip().splitlines())
             for commit in commits
             if isinstance(commit.message, str)
         ]
@@ -59,55 +69,185 @@ class GitClient:
         return Path(self.repo.working_dir).name
 
     def list_files(self, ref: str) -> list[str]:
-        """List all files in the repository at a specific ref."""
-        commit = self.repo.commit(ref)
-        return [
-            str(item.path) for item in commit.tree.traverse() if isinstance(item, Blob)
-        ]
-
-    def is_binary(self, ref: str, file_path: str) -> bool:
-        """Check if a file is binary at a given ref. Symlinks are not binary."""
-        commit = self.repo.commit(ref)
-        blob = commit.tree[file_path]
-        if self.is_symlink(blob):
-            return False
-        chunk: bytes = blob.data_stream.read(8192)
-        return b"\x00" in chunk
+        """List all files in the repository at a specific ref. Submodules are excluded."""
+        commit = self._resolve_commit(ref)
+        output = self.repo.git.ls_tree("-r", "-z", commit.hexsha)
+        files = []
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            info, _, path = entry.partition("\t")
+            _mode, object_type, _sha = info.split(" ")
+            if object_type == "blob":
+                files.append(path)
+        return files
 
     def is_symlink(self, blob: Blob) -> bool:
         """Check if a blob represents a symlink."""
         return blob.mode == 0o120000  # noqa: PLR2004
 
-    def get_file_content(self, ref: str, file_path: str) -> str:
-        commit = self.repo.commit(ref)
+    def get_text_file_content(self, ref: str, file_path: str) -> Optional[str]:
+        """
+        Get file content at a ref, or None if it is binary.
+
+        Only the first BINARY_CHECK_BYTES are read from a binary file.
+        Symlinks are followed, so a link to a binary file counts as binary.
+        """
+        blob_data = read_text_blob(self._get_blob(ref, file_path))
+        if blob_data is None:
+            return None
+        return blob_data.decode("utf-8", errors="replace").strip()
+
+    def _get_blob(self, ref: str, file_path: str) -> Blob:
+        """Get the blob of a file at a ref, following symlinks to their target."""
+        commit = self._resolve_commit(ref)
         blob = commit.tree[file_path]
         if self.is_symlink(blob):
             target = blob.data_stream.read().decode("utf-8").strip()
             resolved = (Path(file_path).parent / target).as_posix()
             blob = commit.tree[resolved]
-        blob_data: bytes = blob.data_stream.read()
-        return blob_data.decode("utf-8", errors="replace").strip()
+        return blob
 
-    def get_diff_index(self, context_lines: int = 999999) -> DiffIndex[Diff]:
+    def get_diff_index(
+        self,
+        context_lines: int = FULL_FILE_CONTEXT_LINES,
+        *,
+        exclude_paths: tuple[str, ...] = (),
+    ) -> DiffIndex[Diff]:
         """
         Get the diff index between the merge-base of base and head commits.
 
         Uses the merge-base (common ancestor) to produce a three-dot diff,
         matching GitHub's PR diff behavior. Falls back to a direct diff
         if no merge-base exists (e.g., unrelated histories).
-        """
-        merge_bases = self.repo.merge_base(self.base_commit, self.head_commit)
-        effective_base = merge_bases[0] if merge_bases else self.base_commit
 
-        return effective_base.diff(
+        Paths in exclude_paths are matched literally and left out of the diff.
+        If they would make the command line too long, nothing is excluded.
+        Function context is skipped for full-file diffs, where it cannot add
+        any lines.
+        """
+        pathspecs = tuple(f":(exclude,literal){path}" for path in exclude_paths)
+        if sum(len(pathspec) + 1 for pathspec in pathspecs) > MAX_PATHSPEC_CHARS:
+            pathspecs = ()
+        return self._get_effective_base().diff(
             self.head_commit,
+            paths=pathspecs or None,
             create_patch=True,
             unified=context_lines,
             diff_algorithm="histogram",
             find_renames=50,
-            function_context=True,
+            function_context=context_lines < FULL_FILE_CONTEXT_LINES,
         )
 
+    def get_changed_paths(self) -> list[str]:
+        """
+        List the paths changed from the same merge-base as get_diff_index.
+
+        Renames are not detected, so a renamed file is listed under both its
+        old and new path. Only trees are compared; no blob content is read.
+        """
+        output: bytes = self.repo.git.diff_tree(
+            "-r",
+            "-z",
+            "--name-only",
+            "--no-renames",
+            self._get_effective_base().hexsha,
+            self.head_commit.hexsha,
+            stdout_as_string=False,
+        )
+        return [
+            path.decode("utf-8", errors="replace")
+            for path in output.split(b"\0")
+            if path
+        ]
+
+    def get_diff_summary(self) -> list[Diff]:
+        """
+        Get the diffs without patches, from the same merge-base as get_diff_index.
+
+        Lists change types, paths and renames without producing patch text.
+        """
+        output: bytes = self.repo.git.diff_tree(
+            "-r",
+            "-z",
+            "--raw",
+            "--full-index",
+            "--find-renames=50",
+            self._get_effective_base().hexsha,
+            self.head_commit.hexsha,
+            stdout_as_string=False,
+        )
+        return _parse_raw_diff(self.repo, output)
+
+    def _resolve_commit(self, ref: str) -> Commit:
+        """Resolve a ref to a commit, reusing the commits resolved for base and head."""
+        if ref == self.head_ref:
+            return self.head_commit
+        if ref == self.base_ref:
+            return self.base_commit
+        return self.repo.commit(ref)
+
+    def _get_effective_base(self) -> Commit:
+        """Return the merge-base of base and head, computed once per base commit."""
+        if self._effective_base is None:
+            merge_bases = self.repo.merge_base(self.base_commit, self.head_commit)
+            self._effective_base = merge_bases[0] if merge_bases else self.base_commit
+        return self._effective_base
+
+
+def _parse_raw_diff(repo: Repo, output: bytes) -> list[Diff]:
+    """
+    Parse `git diff-tree --raw -z` output into Diff objects without patches.
+
+    Entries are read field by field, so a path starting with ':' is not
+    mistaken for the next entry as in GitPython's own raw parser.
+    """
+    diffs = []
+    fields = iter(output.split(b"\0"))
+    for meta in fields:
+        if not meta:
+            continue
+        a_mode, b_mode, a_blob_id, b_blob_id, status = meta[1:].decode().split(" ")
+        change_type = cast("Lit_change_type", status[0])
+        a_path = next(fields)
+        b_path = next(fields) if change_type in {"C", "R"} else a_path
+        is_rename = change_type == "R"
+        diffs.append(
+            Diff(
+                repo,
+                a_path,
+                b_path,
+                a_blob_id,
+                b_blob_id,
+                a_mode,
+                b_mode,
+                new_file=change_type == "A",
+                deleted_file=change_type == "D",
+                copied_file=change_type == "C",
+                raw_rename_from=a_path if is_rename else None,
+                raw_rename_to=b_path if is_rename else None,
+                diff="",
+                change_type=change_type,
+                score=int(status[1:]) if status[1:].isdigit() else None,
+            )
+        )
+    return diffs
+
+
+def read_text_blob(blob: IndexObject) -> Optional[bytes]:
+    """Read a blob's data, or return None after BINARY_CHECK_BYTES if it is binary."""
+    stream = blob.data_stream
+    head: bytes = stream.read(BINARY_CHECK_BYTES)
+    if is_binary_data(head):
+        return None
+    rest: bytes = stream.read()
+    return head + rest
+
+
+def is_binary_data(data: bytes) -> bool:
+    """Check for a NUL byte in the leading bytes of file data, as git does."""
+    return data.find(b"\x00", 0, BINARY_CHECK_BYTES) != -1
+
 
 class InferBaseBranchError(Exception):
     """Raised when unable to infer the default branch from the remote."""
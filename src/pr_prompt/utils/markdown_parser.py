@@ -1,34 +1,35 @@
-from pathlib import Path
+import posixpath
+
+LANG_MAP = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "jsx": "jsx",
+    "tsx": "tsx",
+    "java": "java",
+    "go": "go",
+    "rs": "rust",
+    "cpp": "cpp",
+    "c": "c",
+    "cs": "csharp",
+    "rb": "ruby",
+    "php": "php",
+    "swift": "swift",
+    "kt": "kotlin",
+    "scala": "scala",
+    "sh": "bash",
+    "yml": "yaml",
+    "yaml": "yaml",
+    "json": "json",
+    "xml": "xml",
+    "html": "html",
+    "css": "css",
+    "sql": "sql",
+    "md": "markdown",
+}
 
 
 def get_markdown_content(file_path: str, content: str) -> str:
-    extension = Path(file_path).suffix[1:]
-    lang_map = {
-        "py": "python",
-        "js": "javascript",
-        "ts": "typescript",
-        "jsx": "jsx",
-        "tsx": "tsx",
-        "java": "java",
-        "go": "go",
-        "rs": "rust",
-        "cpp": "cpp",
-        "c": "c",
-        "cs": "csharp",
-        "rb": "ruby",
-        "php": "php",
-        "swift": "swift",
-        "kt": "kotlin",
-        "scala": "scala",
-        "sh": "bash",
-        "yml": "yaml",
-        "yaml": "yaml",
-        "json": "json",
-        "xml": "xml",
-        "html": "html",
-        "css": "css",
-        "sql": "sql",
-        "md": "markdown",
-    }
-    lang = lang_map.get(extension, "text")
+    extension = posixpath.splitext(file_path)[1][1:]
+    lang = LANG_MAP.get(extension, "text")
     return f"~~~{lang}\n{content}\n~~~"
@@ -35,8 +35,9 @@ def create_mock_git_client(
     mock_git.list_files.return_value = files
     mock_git.get_commit_messages.return_value = commit_messages
     mock_git.fetch_base_branch.return_value = None
-    mock_git.get_file_content.return_value = "context file content"
-    mock_git.is_binary.return_value = False
+    mock_git.get_text_file_content.return_value = "context file content"
+    mock_git.base_commit = MagicMock(hexsha="base-sha")
+    mock_git.head_commit = MagicMock(hexsha="head-sha")
     mock_git.repo = MagicMock()
     mock_git.repo.merge_base.return_value = [MagicMock()]
 
@@ -47,9 +48,11 @@ def create_mock_git_client(
         mock_diffs.append(mock_diff)
 
     mock_diff_index = MagicMock(spec=DiffIndex)
-    mock_diff_index.__iter__ = MagicMock(return_value=iter(mock_diffs))
+    mock_diff_index.__iter__ = MagicMock(side_effect=lambda: iter(mock_diffs))
 
     mock_git.get_diff_index.return_value = mock_diff_index
+    mock_git.get_diff_summary.return_value = mock_diff_index
+    mock_git.get_changed_paths.return_value = files
 
     return mock_git
 
@@ -92,4 +95,8 @@ def create_mock_diff(
 
     mock_diff.diff = diff_content.encode()
 
+    # Blob reads return text, so the binary check sees real bytes
+    for blob in (mock_diff.a_blob, mock_diff.b_blob):
+        blob.data_stream.read.return_value = f"content of {file_path}\n".encode()
+
     return mock_diff
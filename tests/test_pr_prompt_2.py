@@ -1,6 +1,7 @@
 """Tests for pr_prompt package."""
 
-from unittest.mock import MagicMock, patch
+import fnmatch
+from unittest.mock import MagicMock, call, patch
 
 from git import Repo
 
@@ -9,7 +10,7 @@ from pr_prompt.markdown_builder import MarkdownBuilder
 from pr_prompt.utils import FileFilter, get_diff_files
 from pr_prompt.utils.git_client import GitClient
 
-from .conftest import create_mock_git_client
+from .conftest import create_mock_diff, create_mock_git_client
 
 
 class TestFileFilter:
@@ -36,6 +37,44 @@ class TestFileFilter:
             "src/utils.py",
         ]
 
+    def test_exclude_agrees_with_fnmatch(self) -> None:
+        """Test the combined pattern regex filters exactly like per-pattern fnmatch."""
+        files = [
+            "main.py",
+            "package-lock.json",
+            "static/styles.min.css",
+            "docs/my notes.md",
+            "src/[draft].py",
+        ]
+        pattern_sets = [
+            ["*lock*", "*.min.*"],
+            ["src/*.py", "*.md"],
+            ["* *"],
+            ["src/[[]draft].py", "*.json"],
+        ]
+        for patterns in pattern_sets:
+            expected = sorted(
+                file
+                for file in files
+                if not any(fnmatch.fnmatch(file, pattern) for pattern in patterns)
+            )
+            assert FileFilter.exclude(files, patterns) == expected
+
+
+class TestDiffParser:
+    """Test conversion of git diffs to diff files."""
+
+    def test_get_diff_files_reads_added_binary_blob_head_only(self) -> None:
+        """Test an added binary file is detected from its first 8 KiB only."""
+        mock_diff = create_mock_diff("logo.png", change_type="added")
+        mock_diff.a_blob = None
+        mock_diff.b_blob.data_stream.read.return_value = b"\x89PNG\x00\x00"
+
+        diff_files = get_diff_files([mock_diff], [])
+
+        assert diff_files["logo.png"].content == "[Binary file]"
+        mock_diff.b_blob.data_stream.read.assert_called_once_with(8192)
+
 
 class TestMarkdownBuilder:
     """Test prompt building functionality."""
@@ -83,6 +122,17 @@ class TestMarkdownBuilder:
         prompt = builder.build()
         assert "context file content" in prompt
 
+    def test_add_context_files_skips_binary(self) -> None:
+        """Test binary context files are skipped without a file section."""
+        mock_git = create_mock_git_client(files=["main.py", "logo.png"])
+        mock_git.get_text_file_content.return_value = None
+
+        builder = MarkdownBuilder(mock_git)
+        builder.add_context_files(["*.png"], [], {})
+
+        prompt = builder.build()
+        assert "logo.png" not in prompt
+
 
 class TestPrPrompt:
     """Test PR prompt generator."""
@@ -122,6 +172,93 @@ class TestPrPrompt:
         assert "File diffs" in prompt
         assert "File diffs" in prompt
 
+    @patch("pr_prompt.generator.GitClient")
+    def test_generate_skips_patch_for_blacklisted_files(
+        self,
+        mock_git_client_class: MagicMock,
+    ) -> None:
+        """Test that patches are only requested for files not blacklisted."""
+        mock_git = create_mock_git_client(files=["main.py", "uv.lock"])
+        mock_git_client_class.return_value = mock_git
+
+        generator = PrPromptGenerator()
+        prompt = generator.generate_review()
+
+        mock_git.get_diff_index.assert_called_once_with(
+            999999, exclude_paths=("uv.lock",)
+        )
+        assert "uv.lock" in prompt
+        assert "[Diff ignored]" in prompt
+
+    @patch("pr_prompt.generator.GitClient")
+    def test_generate_falls_back_to_full_diff_for_missing_patch(
+        self,
+        mock_git_client_class: MagicMock,
+    ) -> None:
+        """Test that a kept file missing from the filtered patch diff triggers a full diff."""
+        mock_git = create_mock_git_client(files=["main.py", "uv.lock"])
+        full_index = mock_git.get_diff_index.return_value
+        mock_git.get_diff_index.side_effect = [[], full_index]
+        mock_git_client_class.return_value = mock_git
+
+        generator = PrPromptGenerator()
+        prompt = generator.generate_review()
+
+        assert mock_git.get_diff_index.call_count == 2  # noqa: PLR2004
+        mock_git.get_diff_index.assert_called_with(999999)
+        assert "+new content in main.py" in prompt
+        assert "[Diff ignored]" in prompt
+
+    @patch("pr_prompt.generator.GitClient")
+    def test_generate_without_blacklist_skips_summary(
+        self,
+        mock_git_client_class: MagicMock,
+    ) -> None:
+        """Test that an empty blacklist needs only the patch diff."""
+        mock_git = create_mock_git_client(files=["main.py", "uv.lock"])
+        mock_git_client_class.return_value = mock_git
+
+        generator = PrPromptGenerator(blacklist_patterns=[])
+        prompt = generator.generate_review()
+
+        mock_git.get_diff_summary.assert_not_called()
+        mock_git.get_diff_index.assert_called_once_with(999999)
+        assert "[Diff ignored]" not in prompt
+
+    @patch("pr_prompt.generator.GitClient")
+    def test_generate_skips_summary_when_no_blacklisted_file_changed(
+        self,
+        mock_git_client_class: MagicMock,
+    ) -> None:
+        """Test that renames are only detected twice when a blacklisted file changed."""
+        mock_git = create_mock_git_client(files=["main.py", "README.md"])
+        mock_git_client_class.return_value = mock_git
+
+        generator = PrPromptGenerator()
+        generator.generate_review()
+
+        mock_git.get_changed_paths.assert_called_once()
+        mock_git.get_diff_summary.assert_not_called()
+        mock_git.get_diff_index.assert_called_once_with(999999)
+
+    @patch("pr_prompt.generator.GitClient")
+    def test_generate_reuses_diff_for_same_commits(
+        self,
+        mock_git_client_class: MagicMock,
+    ) -> None:
+        """Test that consecutive prompts for the same commits diff only once."""
+        mock_git = create_mock_git_client(files=["main.py"])
+        mock_git_client_class.return_value = mock_git
+
+        generator = PrPromptGenerator()
+        review = generator.generate_review()
+        description = generator.generate_description()
+
+        mock_git.get_changed_paths.assert_called_once()
+        mock_git.get_diff_index.assert_called_once()
+        assert "main.py" in review
+        assert "main.py" in description
+
 
 class TestGitClientMergeBase:
     """Test merge-base diff behavior in GitClient."""
@@ -135,6 +272,7 @@ class TestGitClientMergeBase:
         merge_base_commit = MagicMock()
         client.base_commit = MagicMock()
         client.head_commit = MagicMock()
+        client._effective_base = None
         client.repo.merge_base.return_value = [merge_base_commit]
 
         client.get_diff_index(context_lines=3)
@@ -144,6 +282,7 @@ class TestGitClientMergeBase:
         )
         merge_base_commit.diff.assert_called_once_with(
             client.head_commit,
+            paths=None,
             create_patch=True,
             unified=3,
             diff_algorithm="histogram",
@@ -163,12 +302,136 @@ class TestGitClientMergeBase:
 
         client.base_commit = MagicMock()
         client.head_commit = MagicMock()
+        client._effective_base = None
         client.repo.merge_base.return_value = []
 
         client.get_diff_index()
 
         client.base_commit.diff.assert_called_once()
 
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_diff_index_excludes_paths_literally(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that excluded paths become literal pathspecs, dropped when too long."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.base_commit = MagicMock()
+        client.head_commit = MagicMock()
+        client._effective_base = None
+        client.repo.merge_base.return_value = []
+
+        client.get_diff_index(exclude_paths=(":lead.lock", "uv.lock"))
+        _, kwargs = client.base_commit.diff.call_args
+        assert kwargs["paths"] == (
+            ":(exclude,literal):lead.lock",
+            ":(exclude,literal)uv.lock",
+        )
+
+        client.get_diff_index(exclude_paths=tuple(f"{i:05}.lock" for i in range(2000)))
+        _, kwargs = client.base_commit.diff.call_args
+        assert kwargs["paths"] is None
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_changed_paths_lists_names_without_renames(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that changed paths come from one name-only diff without rename detection."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.repo.git = MagicMock()
+        client.head_commit = MagicMock(hexsha="head-sha")
+        client._effective_base = MagicMock(hexsha="base-sha")
+        client.repo.git.diff_tree.return_value = b":lead.py\0old.py\0new.py\0"
+
+        assert client.get_changed_paths() == [":lead.py", "old.py", "new.py"]
+        client.repo.git.diff_tree.assert_called_once_with(
+            "-r",
+            "-z",
+            "--name-only",
+            "--no-renames",
+            "base-sha",
+            "head-sha",
+            stdout_as_string=False,
+        )
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_diff_summary_parses_raw_output(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that raw diff entries are parsed, including paths starting with ':'."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.repo.git = MagicMock()
+        client.base_commit = MagicMock()
+        client.head_commit = MagicMock(hexsha="head-sha")
+        client._effective_base = MagicMock(hexsha="base-sha")
+        a_sha, b_sha, null_sha = "a" * 40, "b" * 40, "0" * 40
+        client.repo.git.diff_tree.return_value = (
+            f":000000 100644 {null_sha} {b_sha} A\0:lead.py\0"
+            f":100644 100644 {a_sha} {b_sha} R087\0old.py\0new.py\0"
+            f":100644 000000 {a_sha} {null_sha} D\0gone.lock\0"
+        ).encode()
+
+        diffs = client.get_diff_summary()
+
+        assert [(d.change_type, d.a_path, d.b_path) for d in diffs] == [
+            ("A", ":lead.py", ":lead.py"),
+            ("R", "old.py", "new.py"),
+            ("D", "gone.lock", "gone.lock"),
+        ]
+        assert diffs[0].new_file
+        assert diffs[0].a_blob is None
+        assert diffs[1].renamed_file
+        assert diffs[1].rename_from == "old.py"
+        assert diffs[2].deleted_file
+        assert diffs[2].b_blob is None
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_merge_base_computed_once_until_fetch(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that the merge-base is reused across diffs and recomputed after a fetch."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.remote = MagicMock()
+        client.remote.name = "origin"
+        client.base_ref = "origin/main"
+        client.base_commit = MagicMock()
+        client.head_commit = MagicMock()
+        client._effective_base = None
+        client.repo.merge_base.return_value = [MagicMock()]
+
+        client.get_diff_index()
+        client.get_diff_index(context_lines=3)
+        assert client.repo.merge_base.call_count == 1
+
+        client.fetch_base_branch()
+        client.get_diff_index()
+        assert client.repo.merge_base.call_count == 2  # noqa: PLR2004
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_diff_index_full_file_skips_function_context(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that full-file diffs do not request function context."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.base_commit = MagicMock()
+        client.head_commit = MagicMock()
+        client._effective_base = None
+        client.repo.merge_base.return_value = []
+
+        client.get_diff_index()
+
+        _, kwargs = client.base_commit.diff.call_args
+        assert kwargs["function_context"] is False
+
     @patch.object(Repo, "__init__", return_value=None)
     def test_fetch_base_branch_re_resolves_commit(
         self,
@@ -193,6 +456,89 @@ class TestGitClientMergeBase:
         assert client.base_commit is new_commit
 
 
+class TestGitClientFiles:
+    """Test listing and reading files at a ref in GitClient."""
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_head_ref_reuses_resolved_commit(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that reads at head_ref use head_commit instead of resolving the ref again."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.base_ref = "origin/main"
+        client.head_ref = "feature/test"
+        client.base_commit = MagicMock()
+        client.head_commit = MagicMock(hexsha="head-sha")
+        client.repo.git = MagicMock()
+        client.repo.git.ls_tree.return_value = ""
+
+        client.list_files("feature/test")
+
+        client.repo.git.ls_tree.assert_called_once_with("-r", "-z", "head-sha")
+        client.repo.commit.assert_not_called()
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_list_files_excludes_submodules(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that list_files returns blobs from ls-tree and skips submodules."""
+        client = object.__new__(GitClient)
+        client.repo = MagicMock(spec=Repo)
+        client.base_ref = "origin/main"
+        client.head_ref = "feature/test"
+        client.repo.git = MagicMock()
+        client.repo.git.ls_tree.return_value = (
+            "100644 blob aaa\tREADME.md\0"
+            "120000 blob bbb\tdocs/link.md\0"
+            "160000 commit ccc\tvendor/lib\0"
+        )
+
+        files = client.list_files("abc123")
+
+        assert files == ["README.md", "docs/link.md"]
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_text_file_content_reads_text(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that text files are decoded and stripped."""
+        client = object.__new__(GitClient)
+        client.base_ref = "origin/main"
+        client.head_ref = "feature/test"
+        client.head_commit = MagicMock()
+        blob = MagicMock(mode=0o100644)
+        blob.data_stream.read.side_effect = [b"print(", b"'hi')\n"]
+        client.head_commit.tree = {"main.py": blob}
+
+        content = client.get_text_file_content("feature/test", "main.py")
+
+        assert content == "print('hi')"
+        assert blob.data_stream.read.call_args_list == [call(8192), call()]
+
+    @patch.object(Repo, "__init__", return_value=None)
+    def test_get_text_file_content_follows_symlink_to_binary(
+        self,
+        _mock_repo_init: MagicMock,  # noqa: PT019
+    ) -> None:
+        """Test that a symlink is judged by its target, so a link to binary data is None."""
+        client = object.__new__(GitClient)
+        client.base_ref = "origin/main"
+        client.head_ref = "feature/test"
+        client.head_commit = MagicMock()
+        link = MagicMock(mode=0o120000)
+        link.data_stream.read.return_value = b"logo.png"
+        image = MagicMock(mode=0o100644)
+        image.data_stream.read.return_value = b"\x89PNG\x00\x00"
+        client.head_commit.tree = {"assets/logo": link, "assets/logo.png": image}
+
+        assert client.get_text_file_content("feature/test", "assets/logo") is None
+        image.data_stream.read.assert_called_once_with(8192)
+
+
 class TestGenerateOverview:
     """Test generate_overview method."""
 